@@ -225,7 +225,7 @@ class A3200(Parameter):
 
         """ Run a home cycle on the given axes. """
 
-        if axes in None:
+        if axes is None:
             axes = "XYZ"
         axes = self.normaxes(axes, "XYZ")
         for axis in axes:
@@ -485,10 +485,14 @@ class A3200(Parameter):
         # Set laser power
         self.power(power)
 
-        # Run zline program
+        # Run zline program and poll its state with increasing intervals
+        # up to 50 ms to reduce the traffic on the command interface
         self.start(task)
-        state = TaskState.program_running
+        pause = 0.001
+        state = self.state(task)
         while state == TaskState.program_running:
+            time.sleep(pause)
+            pause = min(2 * pause, 0.05)
             state = self.state(task)
 
         # Program failure
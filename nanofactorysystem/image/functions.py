@@ -9,7 +9,6 @@
 ##########################################################################
 
 import numpy as np
-import matplotlib.pyplot as plt
 import cv2 as cv
 from skimage.registration import phase_cross_correlation
 
@@ -162,10 +161,13 @@ def normcolor(img, cmap=None):
     """ Normalize given floating point image and convert it to 8-bit BGR
     image. """
 
+    # Import on demand, the colormap registry does not need pyplot
+    from matplotlib import colormaps
+
     if cmap is None:
         cmap = "viridis"
     img = cv.normalize(img, None, 0.0, 1.0, cv.NORM_MINMAX, cv.CV_64F)
-    img = plt.get_cmap(cmap)(img)[:,:,:3]
+    img = colormaps.get_cmap(cmap)(img)[:,:,:3]
     img *= 255
     img = img.astype(np.uint8)
     img = cv.cvtColor(img, cv.COLOR_RGB2BGR)
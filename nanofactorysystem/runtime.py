@@ -10,6 +10,7 @@
 ##########################################################################
 
 import logging
+import logging.handlers
 from pathlib import Path
 from shutil import rmtree
 
@@ -17,9 +18,12 @@ from shutil import rmtree
 LOGFMT = logging.Formatter(fmt="%(asctime)s / %(levelname)s / %(message)s",
                            datefmt="%Y-%m-%d %H:%M:%S")
 
-def getLogger(logfile=None):
+def getLogger(logfile=None, capacity=256):
 
-    """ Configure and return a logger object. """
+    """ Configure and return a logger object. Records for the optional
+    logfile are buffered and written in batches of the given capacity.
+    Warnings and errors flush the buffer immediately. A capacity of
+    None or 0 writes every record directly. """
     
     # Initialize logger object
     logger = logging.getLogger('dummy')
@@ -36,7 +40,13 @@ def getLogger(logfile=None):
         filehandler = logging.FileHandler(logfile)
         filehandler.setLevel(logging.DEBUG)
         filehandler.setFormatter(LOGFMT)
-        logger.addHandler(filehandler)
+        if capacity:
+            memhandler = logging.handlers.MemoryHandler(
+                capacity, flushLevel=logging.WARNING, target=filehandler)
+            memhandler.setLevel(logging.DEBUG)
+            logger.addHandler(memhandler)
+        else:
+            logger.addHandler(filehandler)
     
     # Return logger object
     return logger
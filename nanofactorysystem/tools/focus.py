@@ -31,6 +31,7 @@ class FocusStatus(object):
         ("noncircular", "non-circular"),
         ("offset", "offset"),
         ]
+    _codes = {v: i for i, (v, n) in enumerate(_status)}
 
 
     def status(self, value:int):
@@ -44,8 +45,8 @@ class FocusStatus(object):
         
         assert isinstance(key, str)
         try:
-            value = [v for v,n in self._status].index(key)
-        except ValueError:
+            value = self._codes[key]
+        except KeyError:
             raise AttributeError(f"Unknown attribute '{key}'!")
         return value
 
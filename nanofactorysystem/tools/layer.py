@@ -10,6 +10,8 @@
 ##########################################################################
 
 import math
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from skimage.registration import phase_cross_correlation
 from scidatacontainer import Container
@@ -270,6 +272,17 @@ class Layer(Parameter):
 
     def scan(self, spiral, scanner, mode, path=None):
 
+        # Container files are stored by a background thread, which
+        # overlaps the disk I/O with the next exposure
+        writer = ThreadPoolExecutor(max_workers=1)
+        try:
+            return self._scan(spiral, scanner, mode, path, writer)
+        finally:
+            writer.shutdown()
+
+    def _scan(self, spiral, scanner, mode, path, writer):
+
+        writes = []
         for z, dz in scanner:
 
             # Next exposure coordinates
@@ -280,10 +293,15 @@ class Layer(Parameter):
             self.focus.run(x, y, z, dz, self["laserPower"], self["stageSpeed"], self["duration"])
             focus_dc = self.focus.container()
             if path:
+                # Raise exceptions from the writes of the previous step
+                for write in writes:
+                    write.result()
                 subpath = mkdir(f"{path}/focus-{index:02d}")
-                self.focus.imgPre.write(f"{subpath}/image_pre.zdc")
-                self.focus.imgPost.write(f"{subpath}/image_post.zdc")
-                focus_dc.write(f"{subpath}/focus.zdc")
+                writes = [
+                    writer.submit(self.focus.imgPre.write, f"{subpath}/image_pre.zdc"),
+                    writer.submit(self.focus.imgPost.write, f"{subpath}/image_post.zdc"),
+                    writer.submit(focus_dc.write, f"{subpath}/focus.zdc"),
+                    ]
 
             # Register the focus detection result
             result = self.focus_result()
@@ -314,6 +332,10 @@ class Layer(Parameter):
             status = scanner.status()
             self.log.debug(f"{step:<20} {z:>16} -> {hit:<9} | {status}")
 
+        # Raise exceptions from the writes of the last step
+        for write in writes:
+            write.result()
+
         if not scanner.finished:
             raise LayerDetectionError(f"Layer detection '{mode}' failed!")
         return scanner.result()
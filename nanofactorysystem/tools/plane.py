@@ -94,9 +94,11 @@ class PlaneFit(object):
     def getz(self, x: float, y: float) -> float:
 
         """ Return z value of the plane at the given lateral xy
-        position. """
+        position. The coordinates may also be NumPy arrays of equal
+        shape, e.g. from a meshgrid, which are evaluated in one step. """
 
-        return np.dot(self.params, [x, y, 1])
+        sx, sy, z0 = self.params
+        return sx * x + sy * y + z0
 
 
     def getvec(self, x: float, y: float) -> np.ndarray:
@@ -125,9 +127,10 @@ class zPlane(object):
     def getz(self, x, y):
 
         """ Return z value of the plane at the given lateral xy
-        position. """
+        position. The coordinates may also be NumPy arrays. """
 
-        return np.dot(self.params, [x, y, 1])
+        sx, sy, z0 = self.params
+        return sx * x + sy * y + z0
 
 
 ##########################################################################
@@ -167,8 +170,7 @@ class Plane(Parameter):
     def run(self, x, y, path=None, home=False):
 
         pos = len(self.steps)
-        path = mkdir(f"{path}/layer", clean=False)
-        path = mkdir(f"{path}/layer-{pos:02d}")
+        path = mkdir(f"{path}/layer/layer-{pos:02d}")
 
         # Store current xyz position
         x0, y0, z0 = self.system.position("XYZ")
@@ -30,8 +30,7 @@ class Transform(object):
         """ Return mean value of the horizontal and vertical calibrated pixel
         pitches of the camera in micrometre. """
         
-        pitch = self.P2D
-        pitch *= pitch
+        pitch = self.P2D * self.P2D
         pitch = np.sum(pitch, axis=1)
         pitch = np.sqrt(np.mean(pitch))
         return pitch